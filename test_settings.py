@@ -5,57 +5,87 @@ In a real-world use case, apps in this project are installed into other
 Django applications, so these settings will not be used.
 """
 
-from os.path import abspath, dirname, join
+from pathlib import Path
 
+_HERE = Path(__file__).resolve().parent
 
-def root(*args):
-    """
-    Get the absolute path of the given path relative to the project root.
-    """
-    return join(abspath(dirname(__file__)), *args)
+DEBUG = False
 
 
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': 'default.db',
+        'NAME': ':memory:',
         'USER': '',
         'PASSWORD': '',
         'HOST': '',
         'PORT': '',
+        'TEST': {
+            'NAME': ':memory:',
+        },
     }
 }
 
 INSTALLED_APPS = (
-    'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
-    'django.contrib.messages',
-    'django.contrib.sessions',
     'integrated_channels',
 )
 
 LOCALE_PATHS = [
-    root('integrated_channels', 'conf', 'locale'),
+    str(_HERE / 'integrated_channels' / 'conf' / 'locale'),
 ]
 
 ROOT_URLCONF = 'integrated_channels.urls'
 
+
+class _DisableMigrations:
+    """
+    Tell Django to build test tables directly from models instead of
+    replaying each app's migration history.
+    """
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = _DisableMigrations()
+
 SECRET_KEY = 'insecure-secret-key'
 
-MIDDLEWARE = (
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
-)
+# No test asserts on cache behavior; the dummy backend skips the
+# pickling that even LocMemCache pays on every set.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+}
+
+# Tests never assert on hash strength; skip PBKDF2's several hundred
+# thousand iterations per user creation.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+MIDDLEWARE = ()
 
 TEMPLATES = [{
     'BACKEND': 'django.template.backends.django.DjangoTemplates',
-    'APP_DIRS': False,
     'OPTIONS': {
-        'context_processors': [
-            'django.contrib.auth.context_processors.auth',  # this is required for admin
-            'django.contrib.messages.context_processors.messages',  # this is required for admin
+        'context_processors': (
+            'django.contrib.auth.context_processors.auth',
+        ),
+        # Cache compiled templates in-process so repeated renders only pay
+        # for a single parse. This replaces APP_DIRS, which is implied by
+        # the app_directories loader.
+        'loaders': [
+            ('django.template.loaders.cached.Loader', [
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ]),
         ],
     },
 }]